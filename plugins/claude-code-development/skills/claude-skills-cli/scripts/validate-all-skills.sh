@@ -15,28 +15,89 @@ TOTAL=0
 PASSED=0
 FAILED=0
 
+# Number of skills validated concurrently (override with VALIDATE_JOBS);
+# anything but a positive integer falls back to the CPU count
+JOBS=${VALIDATE_JOBS:-}
+if ! [[ "$JOBS" =~ ^[1-9][0-9]*$ ]]; then
+    JOBS=$(nproc 2>/dev/null || echo 4)
+fi
+
+# Temporary directories, removed on exit
+CLI_DIR=$(mktemp -d)
+RESULTS_DIR=
+trap 'rm -rf "$CLI_DIR" "$RESULTS_DIR"' EXIT
+
+# Resolve the CLI once, before the parallel runs below. When it is not
+# installed, install it a single time rather than letting concurrent npx
+# runs race to install the same package into one cache
+if command -v claude-skills-cli > /dev/null 2>&1; then
+    SKILLS_CLI=(claude-skills-cli)
+elif [ -x "$PWD/node_modules/.bin/claude-skills-cli" ]; then
+    SKILLS_CLI=("$PWD/node_modules/.bin/claude-skills-cli")
+elif npm install --prefix "$CLI_DIR" --no-save --silent claude-skills-cli > /dev/null 2>&1 \
+    && [ -x "$CLI_DIR/node_modules/.bin/claude-skills-cli" ]; then
+    SKILLS_CLI=("$CLI_DIR/node_modules/.bin/claude-skills-cli")
+else
+    # Warm npx's cache with one run so the parallel runs only reuse it
+    npx --yes claude-skills-cli --version > /dev/null 2>&1
+    SKILLS_CLI=(npx --yes claude-skills-cli)
+fi
+
 echo -e "${BLUE}🔍 Finding all skill directories...${NC}"
 echo
 
 echo -e "${BLUE}🔧 Fixing line endings in all markdown files...${NC}"
-# Fix line endings in all markdown files before validation
-find . -type f -name "*.md" -print0 | while IFS= read -r -d $'\0' md_file; do
-    # Convert Windows line endings to Unix format
-    sed -i 's/\r$//' "$md_file"
-done
+# Fix line endings in all markdown files before validation, converting
+# Windows line endings to Unix format with one sed per batch of files
+find . -type f -name "*.md" -exec sed -i 's/\r$//' {} +
 echo "Line endings fixed for all markdown files"
 echo
 
 # Find all SKILL.md files directly
+SKILL_FILES=()
 while IFS= read -r skill_file; do
-    skill_dir=$(dirname "$skill_file")
+    SKILL_FILES+=("$skill_file")
+done < <(find . -type f -name "SKILL.md" | sort)
+
+if [ ${#SKILL_FILES[@]} -eq 0 ]; then
+    echo -e "${RED}💥 No SKILL.md files found${NC}"
+    exit 1
+fi
+
+# Each validation writes its output and exit status here, keyed by index
+RESULTS_DIR=$(mktemp -d)
+
+validate_skill() {
+    local index=$1
+    local skill_dir=$2
+
+    "${SKILLS_CLI[@]}" validate "$skill_dir" > "$RESULTS_DIR/$index.log" 2>&1
+    echo $? > "$RESULTS_DIR/$index.status"
+}
+
+# Validations are independent, so run them in parallel, JOBS at a time
+# (batches with a plain wait keep this working on bash 3.2)
+RUNNING=0
+for i in "${!SKILL_FILES[@]}"; do
+    validate_skill "$i" "$(dirname "${SKILL_FILES[$i]}")" &
+    ((RUNNING++))
+    if [ "$RUNNING" -ge "$JOBS" ]; then
+        wait
+        RUNNING=0
+    fi
+done
+wait
+
+# Report results in the original order
+for i in "${!SKILL_FILES[@]}"; do
+    skill_dir=$(dirname "${SKILL_FILES[$i]}")
     skill_name=$(basename "$skill_dir")
 
     echo -e "${BLUE}🔧 Validating skill: $skill_name${NC}"
     echo "   Path: $skill_dir"
 
-    # Run claude-skills-cli validate
-    if npx claude-skills-cli validate "$skill_dir" 2>&1; then
+    cat "$RESULTS_DIR/$i.log"
+    if [ "$(cat "$RESULTS_DIR/$i.status")" -eq 0 ]; then
         echo -e "${GREEN}✅ Validation passed for: $skill_name${NC}"
         ((PASSED++))
     else
@@ -46,7 +107,7 @@ while IFS= read -r skill_file; do
 
     ((TOTAL++))
     echo "----------------------------------------"
-done < <(find . -type f -name "SKILL.md" | sort)
+done
 
 echo
 echo -e "${BLUE}📊 Validation Summary:${NC}"
@@ -60,4 +121,4 @@ if [ $FAILED -eq 0 ]; then
 else
     echo -e "${RED}💥 Some skills failed validation${NC}"
     exit 1
-fi
\ No newline at end of file
+fi
@@ -9,14 +9,12 @@ It scans for git repositories and checks for updates via GitHub API.
 
 import json
 import sys
-import os
 import subprocess
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 import urllib.request
 import urllib.error
-import urllib.parse
 
 # Configuration
 PLUGINS_DIR = Path.home() / ".claude" / "plugins"
@@ -254,39 +252,38 @@ def format_update_context(updates):
     if not updates:
         return None
 
-    context_lines = ["\n🔄 Plugin Repository Updates"]
-    context_lines.append("")
-
     update_count = sum(1 for u in updates if u.get("has_update"))
     error_count = sum(1 for u in updates if u.get("error"))
 
+    # One pre-formatted block per section/repository, joined once at the end
+    sections = ["\n🔄 Plugin Repository Updates\n"]
+
     if update_count == 0 and error_count == 0:
-        context_lines.append("✅ All plugin repositories are up to date")
-    else:
-        if update_count > 0:
-            context_lines.append(
-                f"⚠️ {update_count} plugin repositor{'y has' if update_count == 1 else 'ies have'} updates available:"
+        sections.append("✅ All plugin repositories are up to date")
+        return "\n".join(sections)
+
+    if update_count > 0:
+        sections.append(
+            f"⚠️ {update_count} plugin repositor{'y has' if update_count == 1 else 'ies have'} updates available:\n"
+        )
+
+    for update in updates:
+        repo_name = update["name"]
+        if update.get("has_update"):
+            latest_commit = update["latest_commit"]
+            sections.append(
+                f"• **{repo_name}**: Updates available\n"
+                f"  - Current: `{update['current_commit']}`\n"
+                f"  - Latest: `{latest_commit['sha'][:7]}`\n"
+                f"  - Message: {latest_commit['message'][:50]}...\n"
+                f"  - Update with: `/plugin marketplace update {repo_name}`\n"
             )
-            context_lines.append("")
-
-        for update in updates:
-            repo_name = update["name"]
-            if update.get("has_update"):
-                latest_commit = update["latest_commit"]
-                context_lines.append(f"• **{repo_name}**: Updates available")
-                context_lines.append(f"  - Current: `{update['current_commit']}`")
-                context_lines.append(f"  - Latest: `{latest_commit['sha'][:7]}`")
-                context_lines.append(f"  - Message: {latest_commit['message'][:50]}...")
-                context_lines.append(
-                    f"  - Update with: `/plugin marketplace update {repo_name}`"
-                )
-                context_lines.append("")
-            elif update.get("error"):
-                context_lines.append(f"• **{repo_name}**: ❌ {update['error']}")
-            else:
-                context_lines.append(f"• **{repo_name}**: ✅ Up to date")
+        elif update.get("error"):
+            sections.append(f"• **{repo_name}**: ❌ {update['error']}")
+        else:
+            sections.append(f"• **{repo_name}**: ✅ Up to date")
 
-    return "\n".join(context_lines)
+    return "\n".join(sections)
 
 
 def main():
@@ -6,12 +6,60 @@ This script scans the plugins directory, extracts metadata from plugin files,
 and generates a marketplace configuration and documentation.
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
 import json
+import os
 import re
-from dataclasses import dataclass
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Thread pool size for the I/O-bound per-plugin work
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Inserts a space before every uppercase letter except the first character
+_CAMEL_CASE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Value of a "description:" key in YAML frontmatter
+_YAML_DESCRIPTION_RE = re.compile(r"description:\s*(.+)")
+
+# Characters GitHub drops when turning a heading into an anchor
+_ANCHOR_STRIP_RE = re.compile(r"[^\w\- ]+")
+
+
+def _load_json(file_path: Union[str, Path]) -> Any:
+    """Parse a JSON file from its raw bytes, or return None if unreadable."""
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # Let the stdlib parser judge input orjson is stricter about
+        return json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return None
 
 
 # ============================================================================
@@ -19,7 +67,7 @@ from datetime import datetime, timezone
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComponentInfo:
     """Information about a plugin component."""
 
@@ -27,22 +75,15 @@ class ComponentInfo:
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PluginComponents:
     """All components within a plugin."""
 
-    commands: List[ComponentInfo]
-    agents: List[ComponentInfo]
-    skills: List[ComponentInfo]
-    hooks: List[ComponentInfo]
-    mcp_servers: List[ComponentInfo]
-
-    def __init__(self):
-        self.commands = []
-        self.agents = []
-        self.skills = []
-        self.hooks = []
-        self.mcp_servers = []
+    commands: Tuple[ComponentInfo, ...] = ()
+    agents: Tuple[ComponentInfo, ...] = ()
+    skills: Tuple[ComponentInfo, ...] = ()
+    hooks: Tuple[ComponentInfo, ...] = ()
+    mcp_servers: Tuple[ComponentInfo, ...] = ()
 
     def get_counts(self) -> Dict[str, int]:
         """Get count of each component type."""
@@ -55,7 +96,7 @@ class PluginComponents:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PluginInfo:
     """Plugin metadata and information."""
 
@@ -65,6 +106,46 @@ class PluginInfo:
     source: str
     components: PluginComponents
 
+    # Derived once at construction and reused by every README renderer
+    install_command: str = field(init=False, repr=False, compare=False)
+    anchor: str = field(init=False, repr=False, compare=False)
+    component_counts: Tuple[int, int, int, int, int] = field(
+        init=False, repr=False, compare=False
+    )
+    content_hash: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen instances have to bypass their own __setattr__ here
+        components = self.components
+        object.__setattr__(
+            self,
+            "install_command",
+            f"/plugin install {self.key}@{PluginManager.MARKETPLACE_NAME}",
+        )
+        object.__setattr__(self, "anchor", PluginManager.generate_anchor(self.name))
+        object.__setattr__(
+            self,
+            "component_counts",
+            (
+                len(components.commands),
+                len(components.agents),
+                len(components.skills),
+                len(components.hooks),
+                len(components.mcp_servers),
+            ),
+        )
+        # Fingerprint of everything the plugin README is rendered from
+        object.__setattr__(
+            self,
+            "content_hash",
+            hashlib.blake2b(
+                repr((self.name, self.key, self.description, components)).encode(
+                    "utf-8"
+                ),
+                digest_size=16,
+            ).hexdigest(),
+        )
+
 
 # ============================================================================
 # Text Extraction and Processing
@@ -88,28 +169,27 @@ class TextExtractor:
             return TextExtractor.DEFAULT_PLUGIN_DESC
 
         try:
-            content = readme_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
             description_lines = []
             in_description = False
             heading_count = 0
 
-            for line in lines:
-                line = line.strip()
+            # Stream lines so reading stops at the second heading
+            with open(readme_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
 
-                # Track headings to find description boundaries
-                if line.startswith("#"):
-                    heading_count += 1
-                    if heading_count == 1:
-                        in_description = True
-                        continue
-                    elif heading_count == 2:
-                        break
+                    # Track headings to find description boundaries
+                    if line.startswith("#"):
+                        heading_count += 1
+                        if heading_count == 1:
+                            in_description = True
+                            continue
+                        elif heading_count == 2:
+                            break
 
-                # Collect description text
-                if in_description and line and not line.startswith("#"):
-                    description_lines.append(line)
+                    # Collect description text
+                    if in_description and line and not line.startswith("#"):
+                        description_lines.append(line)
 
             if description_lines:
                 description = " ".join(description_lines)
@@ -118,7 +198,7 @@ class TextExtractor:
                 )
 
         except (FileNotFoundError, UnicodeDecodeError) as e:
-            print(f"Warning: Could not read {readme_path}: {e}")
+            print(f"Warning: Could not read {readme_path}: {e}", file=sys.stderr)
 
         return TextExtractor.DEFAULT_PLUGIN_DESC
 
@@ -128,33 +208,44 @@ class TextExtractor:
         if not file_path.exists():
             return TextExtractor.DEFAULT_COMPONENT_DESC
 
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
+        description = TextExtractor.read_component_description(file_path)
+        if description is None:
+            return TextExtractor.DEFAULT_COMPONENT_DESC
+        return description
 
-            # Try YAML frontmatter first
-            if lines and lines[0].strip() == "---":
-                yaml_desc = TextExtractor._extract_from_yaml(lines[1:])
-                if yaml_desc:
-                    return yaml_desc
+    @staticmethod
+    def read_component_description(file_path: Path) -> Optional[str]:
+        """Like extract_component_description, for a file already known to exist.
+
+        Returns None, after printing a warning, if the file cannot be read.
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                # Try YAML frontmatter first, reading no further than its end
+                if f.readline().strip() == "---":
+                    yaml_desc = TextExtractor._extract_from_yaml(f)
+                    if yaml_desc:
+                        return yaml_desc
 
-            # Fallback to first paragraph
-            return TextExtractor._extract_first_paragraph(lines)
+                # Fallback to first paragraph, scanned from the top of the file
+                f.seek(0)
+                return TextExtractor._extract_first_paragraph(f)
 
         except (FileNotFoundError, UnicodeDecodeError) as e:
-            print(f"Warning: Could not read {file_path}: {e}")
+            print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
 
-        return TextExtractor.DEFAULT_COMPONENT_DESC
+        return None
 
     @staticmethod
-    def _extract_from_yaml(lines: List[str]) -> Optional[str]:
+    def _extract_from_yaml(lines: Iterable[str]) -> Optional[str]:
         """Extract description from YAML frontmatter."""
         for line in lines:
-            if line.strip() == "---":
+            line = line.strip()
+            if line == "---":
                 break
 
-            if line.strip().startswith("description:"):
-                match = re.match(r"description:\s*(.+)", line.strip())
+            if line.startswith("description:"):
+                match = _YAML_DESCRIPTION_RE.match(line)
                 if match:
                     description = match.group(1).strip()
                     # Remove quotes
@@ -165,7 +256,7 @@ class TextExtractor:
         return None
 
     @staticmethod
-    def _extract_first_paragraph(lines: List[str]) -> str:
+    def _extract_first_paragraph(lines: Iterable[str]) -> str:
         """Extract first paragraph after heading."""
         description_lines = []
         started = False
@@ -173,13 +264,15 @@ class TextExtractor:
         for line in lines:
             line = line.strip()
 
-            if not line or line.startswith("#"):
-                if line.startswith("#") and started:
+            if not line:
+                continue
+            if line[0] == "#":
+                # A heading after the paragraph has started ends it
+                if started:
                     break
                 continue
 
-            if not started:
-                started = True
+            started = True
 
             description_lines.append(line)
             if len(description_lines) >= 3:
@@ -196,12 +289,42 @@ class TextExtractor:
     @staticmethod
     def _clean_and_truncate(text: str, max_length: int) -> str:
         """Clean up whitespace and truncate text to maximum length."""
-        text = re.sub(r"\s+", " ", text).strip()
+        text = " ".join(text.split())
         if len(text) > max_length:
             return text[: max_length - 3] + "..."
         return text
 
 
+class DescriptionCache:
+    """Component descriptions as [size, mtime_ns, description] keyed by file path.
+
+    Entries from the previous build are reused while the file is unchanged,
+    and the ones used in this build are collected in ``current`` for saving.
+    """
+
+    def __init__(self, previous: Optional[Dict[str, List[Any]]] = None) -> None:
+        self.previous = previous or {}
+        self.current: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, file_path: str, file_stat: os.stat_result) -> str:
+        """Get a component file's description, reusing the previous build's
+        result when the file's size and mtime are unchanged."""
+        fingerprint = [file_stat.st_size, file_stat.st_mtime_ns]
+        cached = self.previous.get(file_path)
+        if cached is not None and cached[:2] == fingerprint:
+            description = cached[2]
+        else:
+            description = TextExtractor.read_component_description(Path(file_path))
+            if description is None:
+                # Unreadable files are not cached, so the warning repeats
+                return TextExtractor.DEFAULT_COMPONENT_DESC
+
+        with self._lock:
+            self.current[file_path] = fingerprint + [description]
+        return description
+
+
 # ============================================================================
 # Component Discovery
 # ============================================================================
@@ -210,163 +333,198 @@ class TextExtractor:
 class ComponentDiscovery:
     """Discovers and catalogs plugin components."""
 
+    # hooks.json files above this size are streamed with ijson when available
+    HOOKS_STREAM_THRESHOLD = 64 * 1024
+
     @staticmethod
-    def discover_all(plugin_dir: Path) -> PluginComponents:
+    def discover_all(
+        plugin_dir: Path, descriptions: Optional[DescriptionCache] = None
+    ) -> PluginComponents:
         """Discover all components in a plugin directory."""
-        components = PluginComponents()
+        if descriptions is None:
+            descriptions = DescriptionCache()
+
+        # One listing of the plugin root tells which component directories
+        # exist, so absent ones are never opened or stat'ed
+        with os.scandir(plugin_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+
+        def discover(
+            dir_name: str,
+            discover_fn: Callable[[Path, DescriptionCache], Iterable[ComponentInfo]],
+        ) -> Tuple[ComponentInfo, ...]:
+            if dir_name not in present:
+                return ()
+            return tuple(discover_fn(plugin_dir, descriptions))
+
+        return PluginComponents(
+            commands=discover("commands", ComponentDiscovery._discover_commands),
+            agents=discover("agents", ComponentDiscovery._discover_agents),
+            skills=discover("skills", ComponentDiscovery._discover_skills),
+            hooks=discover("hooks", ComponentDiscovery._discover_hooks),
+            mcp_servers=discover(
+                "mcp_servers", ComponentDiscovery._discover_mcp_servers
+            ),
+        )
 
-        components.commands = ComponentDiscovery._discover_commands(plugin_dir)
-        components.agents = ComponentDiscovery._discover_agents(plugin_dir)
-        components.skills = ComponentDiscovery._discover_skills(plugin_dir)
-        components.hooks = ComponentDiscovery._discover_hooks(plugin_dir)
-        components.mcp_servers = ComponentDiscovery._discover_mcp_servers(plugin_dir)
+    @staticmethod
+    def _scan_sorted(directory: Path) -> List[os.DirEntry]:
+        """List directory entries sorted by name, or nothing if it is missing."""
+        try:
+            with os.scandir(directory) as entries:
+                return sorted(entries, key=attrgetter("name"))
+        except (FileNotFoundError, NotADirectoryError):
+            return []
 
-        return components
+    @staticmethod
+    def _discover_markdown(
+        directory: Path, descriptions: DescriptionCache
+    ) -> Iterator[ComponentInfo]:
+        """Discover components defined as *.md files directly in a directory."""
+        for entry in ComponentDiscovery._scan_sorted(directory):
+            if entry.name.endswith(".md") and entry.is_file():
+                yield ComponentInfo(
+                    name=entry.name[: -len(".md")],
+                    description=descriptions.describe(entry.path, entry.stat()),
+                )
 
     @staticmethod
-    def _discover_commands(plugin_dir: Path) -> List[ComponentInfo]:
+    def _discover_commands(
+        plugin_dir: Path, descriptions: DescriptionCache
+    ) -> Iterator[ComponentInfo]:
         """Discover command components."""
-        commands_dir = plugin_dir / "commands"
-        if not commands_dir.exists():
-            return []
-
-        return [
-            ComponentInfo(
-                name=cmd_file.stem,
-                description=TextExtractor.extract_component_description(cmd_file),
-            )
-            for cmd_file in sorted(commands_dir.glob("*.md"))
-        ]
+        return ComponentDiscovery._discover_markdown(
+            plugin_dir / "commands", descriptions
+        )
 
     @staticmethod
-    def _discover_agents(plugin_dir: Path) -> List[ComponentInfo]:
+    def _discover_agents(
+        plugin_dir: Path, descriptions: DescriptionCache
+    ) -> Iterator[ComponentInfo]:
         """Discover agent components."""
-        agents_dir = plugin_dir / "agents"
-        if not agents_dir.exists():
-            return []
-
-        return [
-            ComponentInfo(
-                name=agent_file.stem,
-                description=TextExtractor.extract_component_description(agent_file),
-            )
-            for agent_file in sorted(agents_dir.glob("*.md"))
-        ]
+        return ComponentDiscovery._discover_markdown(
+            plugin_dir / "agents", descriptions
+        )
 
     @staticmethod
-    def _discover_skills(plugin_dir: Path) -> List[ComponentInfo]:
+    def _discover_skills(
+        plugin_dir: Path, descriptions: DescriptionCache
+    ) -> Iterator[ComponentInfo]:
         """Discover skill components."""
-        skills_dir = plugin_dir / "skills"
-        if not skills_dir.exists():
-            return []
-
-        skills = []
-        for skill_dir in sorted(skills_dir.iterdir()):
-            skill_file = skill_dir / "SKILL.md"
-            if skill_dir.is_dir() and skill_file.exists():
-                skills.append(
-                    ComponentInfo(
-                        name=skill_dir.name,
-                        description=TextExtractor.extract_component_description(
-                            skill_file
-                        ),
-                    )
+        for entry in ComponentDiscovery._scan_sorted(plugin_dir / "skills"):
+            if not entry.is_dir():
+                continue
+            skill_file = os.path.join(entry.path, "SKILL.md")
+            # One stat serves as the existence check and the cache fingerprint
+            try:
+                skill_stat = os.stat(skill_file)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if stat.S_ISREG(skill_stat.st_mode):
+                yield ComponentInfo(
+                    name=entry.name,
+                    description=descriptions.describe(skill_file, skill_stat),
                 )
-        return skills
 
     @staticmethod
-    def _discover_hooks(plugin_dir: Path) -> List[ComponentInfo]:
+    def _discover_hooks(
+        plugin_dir: Path, descriptions: DescriptionCache
+    ) -> Iterator[ComponentInfo]:
         """Discover hook components."""
         hooks_dir = plugin_dir / "hooks"
-        if not hooks_dir.exists():
-            return []
-
         hooks_json = hooks_dir / "hooks.json"
-        if hooks_json.exists():
-            return ComponentDiscovery._parse_hooks_json(hooks_json)
+        if hooks_json.is_file():
+            yield from ComponentDiscovery._parse_hooks_json(hooks_json)
+            return
 
         # Fallback to markdown files
-        return [
-            ComponentInfo(
-                name=hook_file.stem,
-                description=TextExtractor.extract_component_description(hook_file),
-            )
-            for hook_file in sorted(hooks_dir.glob("*.md"))
-        ]
+        yield from ComponentDiscovery._discover_markdown(hooks_dir, descriptions)
 
     @staticmethod
     def _parse_hooks_json(hooks_json: Path) -> List[ComponentInfo]:
         """Parse hooks from hooks.json file."""
         try:
-            with open(hooks_json, "r", encoding="utf-8") as f:
-                hooks_data = json.load(f)
-
-            hooks = []
-            if isinstance(hooks_data, dict) and "hooks" in hooks_data:
-                hooks_section = hooks_data["hooks"]
-                if isinstance(hooks_section, dict):
-                    for hook_event, hook_configs in hooks_section.items():
-                        if isinstance(hook_configs, list):
-                            for i, hook_config in enumerate(hook_configs):
-                                if isinstance(hook_config, dict):
-                                    hooks.append(
-                                        ComponentInfo(
-                                            name=f"{hook_event}_{i}",
-                                            description=hook_config.get(
-                                                "description", f"Hook for {hook_event}"
-                                            ),
-                                        )
-                                    )
-                elif isinstance(hooks_section, list):
-                    for hook in hooks_section:
-                        if isinstance(hook, dict):
-                            hooks.append(
-                                ComponentInfo(
-                                    name=hook.get("name", "Unknown"),
-                                    description=hook.get(
-                                        "description", "No description"
-                                    ),
-                                )
-                            )
-            elif isinstance(hooks_data, list):
-                for hook in hooks_data:
-                    hooks.append(
-                        ComponentInfo(
-                            name=hook.get("name", "Unknown"),
-                            description=hook.get("description", "No description"),
-                        )
-                    )
-            return hooks
+            if (
+                ijson is not None
+                and os.path.getsize(hooks_json)
+                > ComponentDiscovery.HOOKS_STREAM_THRESHOLD
+            ):
+                hooks = ComponentDiscovery._stream_hooks_json(hooks_json)
+                if hooks:
+                    return hooks
+        except FileNotFoundError:
+            return []
+
+        return ComponentDiscovery._hooks_from_data(_load_json(hooks_json))
 
-        except (json.JSONDecodeError, FileNotFoundError):
+    @staticmethod
+    def _hooks_from_data(hooks_data: Any) -> List[ComponentInfo]:
+        """Flatten parsed hooks.json data in any of its supported layouts.
+
+        Handles ``{"hooks": {event: [config, ...]}}``, ``{"hooks": [hook, ...]}``
+        and a bare ``[hook, ...]`` list.
+        """
+        if isinstance(hooks_data, dict):
+            hooks_data = hooks_data.get("hooks")
+            if isinstance(hooks_data, dict):
+                return ComponentDiscovery._hooks_from_events(hooks_data.items())
+
+        if not isinstance(hooks_data, list):
             return []
 
+        return [
+            ComponentInfo(
+                name=hook.get("name", "Unknown"),
+                description=hook.get("description", "No description"),
+            )
+            for hook in hooks_data
+            if isinstance(hook, dict)
+        ]
+
     @staticmethod
-    def _discover_mcp_servers(plugin_dir: Path) -> List[ComponentInfo]:
-        """Discover MCP server components."""
-        mcp_dir = plugin_dir / "mcp_servers"
-        if not mcp_dir.exists():
+    def _hooks_from_events(events: Iterable[Tuple[str, Any]]) -> List[ComponentInfo]:
+        """Build one component per hook config from (event, configs) pairs."""
+        return [
+            ComponentInfo(
+                name=f"{hook_event}_{i}",
+                description=hook_config.get("description", f"Hook for {hook_event}"),
+            )
+            for hook_event, hook_configs in events
+            if isinstance(hook_configs, list)
+            for i, hook_config in enumerate(hook_configs)
+            if isinstance(hook_config, dict)
+        ]
+
+    @staticmethod
+    def _stream_hooks_json(hooks_json: Path) -> List[ComponentInfo]:
+        """Stream event hooks from a large hooks.json without loading it whole.
+
+        Only the standard ``{"hooks": {event: [...]}}`` layout is streamed; an
+        empty result lets the caller fall back to a full parse.
+        """
+        try:
+            with open(hooks_json, "rb") as f:
+                return ComponentDiscovery._hooks_from_events(ijson.kvitems(f, "hooks"))
+        except ijson.JSONError:
             return []
 
-        mcp_servers = []
-        for mcp_file in sorted(mcp_dir.glob("*.json")):
-            try:
-                with open(mcp_file, "r", encoding="utf-8") as f:
-                    mcp_data = json.load(f)
-                    mcp_servers.append(
-                        ComponentInfo(
-                            name=mcp_file.stem,
-                            description=mcp_data.get(
-                                "description", "No description available"
-                            ),
-                        )
-                    )
-            except (json.JSONDecodeError, FileNotFoundError):
-                mcp_servers.append(
-                    ComponentInfo(name=mcp_file.stem, description="Configuration file")
+    @staticmethod
+    def _discover_mcp_servers(
+        plugin_dir: Path, descriptions: DescriptionCache
+    ) -> Iterator[ComponentInfo]:
+        """Discover MCP server components (described by their JSON, not cached)."""
+        for entry in ComponentDiscovery._scan_sorted(plugin_dir / "mcp_servers"):
+            if not (entry.name.endswith(".json") and entry.is_file()):
+                continue
+            name = entry.name[: -len(".json")]
+            mcp_data = _load_json(entry.path)
+            if isinstance(mcp_data, dict):
+                yield ComponentInfo(
+                    name=name,
+                    description=mcp_data.get("description", "No description available"),
                 )
-
-        return mcp_servers
+            else:
+                yield ComponentInfo(name=name, description="Configuration file")
 
 
 # ============================================================================
@@ -379,26 +537,23 @@ class PluginManager:
 
     MARKETPLACE_NAME = "rigerc-claude"
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_plugin_json(plugin_dir: Path) -> Dict[str, Any]:
+        """Parse .claude-plugin/plugin.json once per plugin, empty if unusable."""
+        plugin_data = _load_json(plugin_dir / ".claude-plugin" / "plugin.json")
+        return plugin_data if isinstance(plugin_data, dict) else {}
+
     @staticmethod
     def get_plugin_name_from_json(plugin_dir: Path) -> str:
         """Get plugin name from .claude-plugin/plugin.json, fallback to directory name."""
-        plugin_json_path = plugin_dir / ".claude-plugin" / "plugin.json"
-
-        if plugin_json_path.exists():
-            try:
-                with open(plugin_json_path, "r", encoding="utf-8") as f:
-                    plugin_data = json.load(f)
-                    return plugin_data.get("name", plugin_dir.name)
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
-
-        return plugin_dir.name
+        return PluginManager._load_plugin_json(plugin_dir).get("name", plugin_dir.name)
 
     @staticmethod
     def format_plugin_name(plugin_name: str) -> str:
         """Convert plugin name to proper title format."""
         # Handle camelCase
-        name = re.sub(r"(?<!^)(?=[A-Z])", " ", plugin_name)
+        name = _CAMEL_CASE_RE.sub(" ", plugin_name)
         # Replace hyphens with spaces
         name = name.replace("-", " ")
         # Title case
@@ -407,10 +562,12 @@ class PluginManager:
     @staticmethod
     def generate_anchor(plugin_name: str) -> str:
         """Generate URL-safe anchor from plugin name."""
-        return plugin_name.lower().replace(" ", "-")
+        return _ANCHOR_STRIP_RE.sub("", plugin_name.lower()).replace(" ", "-")
 
     @staticmethod
-    def extract_plugin_info(plugin_dir: Path) -> PluginInfo:
+    def extract_plugin_info(
+        plugin_dir: Path, descriptions: Optional[DescriptionCache] = None
+    ) -> PluginInfo:
         """Extract complete plugin information."""
         plugin_json_name = PluginManager.get_plugin_name_from_json(plugin_dir)
         plugin_name = PluginManager.format_plugin_name(plugin_json_name)
@@ -422,7 +579,7 @@ class PluginManager:
             description = TextExtractor.extract_plugin_description(plugin_dir)
 
         # Discover all components
-        components = ComponentDiscovery.discover_all(plugin_dir)
+        components = ComponentDiscovery.discover_all(plugin_dir, descriptions)
 
         return PluginInfo(
             name=plugin_name,
@@ -435,44 +592,77 @@ class PluginManager:
     @staticmethod
     def _get_description_from_json(plugin_dir: Path) -> Optional[str]:
         """Get description from plugin.json if available."""
-        plugin_json_path = plugin_dir / ".claude-plugin" / "plugin.json"
+        return PluginManager._load_plugin_json(plugin_dir).get("description")
 
-        if plugin_json_path.exists():
-            try:
-                with open(plugin_json_path, "r", encoding="utf-8") as f:
-                    plugin_data = json.load(f)
-                    return plugin_data.get("description")
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+    @staticmethod
+    def find_plugin_dirs(plugins_dir: Path) -> List[Path]:
+        """List plugin directories, i.e. those with a plugin.json or README.md."""
+        with os.scandir(plugins_dir) as entries:
+            # DirEntry.is_dir() answers from the directory listing, no stat needed
+            candidates = [
+                Path(entry.path)
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
 
-        return None
+        return [
+            plugin_dir
+            for plugin_dir in candidates
+            if (plugin_dir / ".claude-plugin" / "plugin.json").exists()
+            or (plugin_dir / "README.md").exists()
+        ]
+
+    @staticmethod
+    def _try_extract_plugin_info(
+        plugin_dir: Path, descriptions: DescriptionCache
+    ) -> Tuple[Optional[PluginInfo], Optional[Exception]]:
+        """Extract plugin information, returning the error instead of raising."""
+        try:
+            return PluginManager.extract_plugin_info(plugin_dir, descriptions), None
+        except Exception as e:
+            return None, e
 
     @staticmethod
-    def discover_plugins(plugins_dir: Path) -> List[PluginInfo]:
+    def discover_plugins(
+        plugins_dir: Path, descriptions: Optional[DescriptionCache] = None
+    ) -> List[PluginInfo]:
         """Discover all valid plugins in the plugins directory."""
         if not plugins_dir.exists():
-            print(f"Warning: Plugins directory {plugins_dir} does not exist")
+            print(
+                f"Warning: Plugins directory {plugins_dir} does not exist",
+                file=sys.stderr,
+            )
             return []
 
-        plugins = []
-        for plugin_dir in plugins_dir.iterdir():
-            if not plugin_dir.is_dir() or plugin_dir.name.startswith("."):
-                continue
+        if descriptions is None:
+            descriptions = DescriptionCache()
 
-            # Check if it's a valid plugin
-            plugin_json = plugin_dir / ".claude-plugin" / "plugin.json"
-            readme = plugin_dir / "README.md"
+        plugins = []
+        plugin_dirs = PluginManager.find_plugin_dirs(plugins_dir)
+
+        # Plugins are independent and mostly file I/O, so extract them
+        # concurrently and report in directory order afterwards
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            results = list(
+                executor.map(
+                    PluginManager._try_extract_plugin_info,
+                    plugin_dirs,
+                    [descriptions] * len(plugin_dirs),
+                )
+            )
 
-            if plugin_json.exists() or readme.exists():
-                try:
-                    plugin_info = PluginManager.extract_plugin_info(plugin_dir)
-                    plugins.append(plugin_info)
-                    print(f"✓ Discovered plugin: {plugin_info.name}")
-                except Exception as e:
-                    print(f"✗ Error processing plugin {plugin_dir.name}: {e}")
+        for plugin_dir, (plugin_info, error) in zip(plugin_dirs, results):
+            if error is not None:
+                print(
+                    f"✗ Error processing plugin {plugin_dir.name}: {error}",
+                    file=sys.stderr,
+                )
+                continue
+            plugins.append(plugin_info)
+            print(f"✓ Discovered plugin: {plugin_info.name}")
 
         # Sort by name
-        plugins.sort(key=lambda x: x.name)
+        plugins.sort(key=attrgetter("name"))
         return plugins
 
 
@@ -487,18 +677,14 @@ class VersionManager:
     DEFAULT_VERSION = "1.0.0"
 
     @staticmethod
-    def get_current_version(marketplace_file: Path) -> str:
-        """Get current version from existing marketplace file."""
-        if marketplace_file.exists():
-            try:
-                with open(marketplace_file, "r", encoding="utf-8") as f:
-                    marketplace = json.load(f)
-                    return marketplace.get("metadata", {}).get(
-                        "version", VersionManager.DEFAULT_VERSION
-                    )
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
-        return VersionManager.DEFAULT_VERSION
+    def get_current_version(marketplace: Optional[Dict[str, Any]]) -> str:
+        """Get current version from already-parsed marketplace data."""
+        if marketplace is None:
+            return VersionManager.DEFAULT_VERSION
+        metadata = marketplace.get("metadata")
+        if not isinstance(metadata, dict):
+            return VersionManager.DEFAULT_VERSION
+        return metadata.get("version", VersionManager.DEFAULT_VERSION)
 
     @staticmethod
     def increment_version(version: str) -> str:
@@ -514,54 +700,11 @@ class VersionManager:
 
 
 # ============================================================================
-# Generators
+# Templates
 # ============================================================================
 
-
-class MarketplaceGenerator:
-    """Generates marketplace.json configuration."""
-
-    @staticmethod
-    def generate(plugins: List[PluginInfo], marketplace_file: Path) -> Dict[str, Any]:
-        """Generate marketplace.json structure."""
-        current_version = VersionManager.get_current_version(marketplace_file)
-        new_version = VersionManager.increment_version(current_version)
-
-        print(f"Version: {current_version} -> {new_version}")
-
-        return {
-            "name": PluginManager.MARKETPLACE_NAME,
-            "owner": {"name": "rigerc's Claude personal marketplace"},
-            "metadata": {
-                "version": new_version,
-                "description": "A curated collection of specialized plugins for Claude Code, "
-                "organized by functionality to provide focused tools for specific development tasks.",
-                "lastUpdated": datetime.now(timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z"),
-            },
-            "plugins": [
-                {
-                    "name": plugin.key,
-                    "source": plugin.source,
-                    "description": plugin.description,
-                }
-                for plugin in plugins
-            ],
-        }
-
-
-class ReadmeGenerator:
-    """Generates README.md documentation."""
-
-    @staticmethod
-    def generate_main_readme(plugins: List[PluginInfo]) -> str:
-        """Generate main README.md for the marketplace."""
-        toc = ReadmeGenerator._generate_toc(plugins)
-        plugin_details = ReadmeGenerator._generate_plugin_details(plugins)
-        summary = ReadmeGenerator._generate_summary(plugins)
-
-        return f"""# Claude Extensions Plugin Collection
+# Rendered with str.format_map; literal braces must be doubled
+_MAIN_README_TEMPLATE = """# Claude Extensions Plugin Collection
 
 A curated collection of specialized plugins for Claude Code, organized by functionality to provide focused tools for specific development tasks.
 
@@ -601,16 +744,16 @@ Install only the plugins you need:
 
 ```bash
 # Example installations
-/plugin install claude-code-development@{PluginManager.MARKETPLACE_NAME}
-/plugin install bash-scripting@{PluginManager.MARKETPLACE_NAME}
-/plugin install documentation-generation@{PluginManager.MARKETPLACE_NAME}
+/plugin install claude-code-development@{marketplace_name}
+/plugin install bash-scripting@{marketplace_name}
+/plugin install documentation-generation@{marketplace_name}
 ```
 
 ### Browse Available Plugins
 
 ```bash
 /plugin
-# Select "Browse Plugins" from {PluginManager.MARKETPLACE_NAME} marketplace
+# Select "Browse Plugins" from {marketplace_name} marketplace
 # Install desired plugins
 ```
 
@@ -619,7 +762,6 @@ Install only the plugins you need:
 ## 🔌 Plugin Details
 
 {plugin_details}
-
 ---
 
 ## 📁 Plugin Structure
@@ -681,80 +823,240 @@ All plugins in this collection are licensed under MIT License.
 *This README is automatically generated. Do not edit manually - run `python scripts/build-marketplace.py` to update.*
 """
 
+
+_PLUGIN_README_TEMPLATE = """# {name}
+
+{description}
+
+## Overview
+
+This plugin provides the following components:
+
+{component_section}
+## Installation
+
+Install this plugin from the {marketplace_name} marketplace:
+
+```bash
+{install_command}
+```
+
+## Usage
+
+After installation, the components provided by this plugin will be available in your Claude Code environment.
+
+- **Commands** can be used with slash commands (e.g., `/command-name`)
+- **Agents** provide specialized expertise for specific tasks
+- **Skills** enhance agent capabilities for particular domains
+- **Hooks** automate workflows and git operations
+- **MCP Servers** provide external tool integrations
+
+## Development
+
+This plugin is part of the {marketplace_name} marketplace collection. For development details, see the main repository.
+
+---
+
+*This README is automatically generated. Do not edit manually - run `python scripts/build-marketplace.py` to update.*
+"""
+
+
+# Plugin README component sections: (PluginComponents field, heading, item
+# template formatted with the ComponentInfo as {0})
+_PLUGIN_README_SECTIONS = (
+    ("commands", "Commands", "### `{0.name}`\n{0.description}\n\n"),
+    ("agents", "Agents", "### {0.name}\n{0.description}\n\n"),
+    ("skills", "Skills", "### {0.name}\n{0.description}\n\n"),
+    ("hooks", "Hooks", "### {0.name}\n{0.description}\n\n"),
+    ("mcp_servers", "MCP Servers", "### {0.name}\n{0.description}\n\n"),
+)
+
+
+# Section headers of the main README plugin details, completed with "<count>):"
+_CMD_HDR = "\n**Commands** ("
+_AGENT_HDR = "\n**Agents** ("
+_SKILL_HDR = "\n**Skills** ("
+_HOOK_HDR = "\n**Hooks** ("
+_MCP_HDR = "\n**MCP Servers** ("
+
+
+# ============================================================================
+# Generators
+# ============================================================================
+
+
+class MarketplaceGenerator:
+    """Generates marketplace.json configuration."""
+
+    OWNER_NAME = "rigerc's Claude personal marketplace"
+    DESCRIPTION = (
+        "A curated collection of specialized plugins for Claude Code, "
+        "organized by functionality to provide focused tools for specific development tasks."
+    )
+
+    # Metadata that changes on every build and is ignored when diffing
+    VOLATILE_METADATA_KEYS = ("version", "lastUpdated")
+
     @staticmethod
-    def _generate_toc(plugins: List[PluginInfo]) -> str:
-        """Generate table of contents for plugins."""
-        lines = []
-        for plugin in plugins:
-            anchor = PluginManager.generate_anchor(plugin.name)
-            lines.append(f"  - [{plugin.name}](#{anchor})")
-        return "\n".join(lines)
+    def serialize(marketplace_data: Dict[str, Any]) -> bytes:
+        """Serialize marketplace data as 2-space indented UTF-8 JSON."""
+        if orjson is not None:
+            return orjson.dumps(marketplace_data, option=orjson.OPT_INDENT_2)
+        return json.dumps(marketplace_data, indent=2, ensure_ascii=False).encode(
+            "utf-8"
+        )
 
     @staticmethod
-    def _generate_summary(plugins: List[PluginInfo]) -> str:
-        """Generate collection summary statistics."""
-        total_commands = sum(len(p.components.commands) for p in plugins)
-        total_agents = sum(len(p.components.agents) for p in plugins)
-        total_skills = sum(len(p.components.skills) for p in plugins)
-        total_hooks = sum(len(p.components.hooks) for p in plugins)
-        total_mcp = sum(len(p.components.mcp_servers) for p in plugins)
+    def load_existing(marketplace_file: Path) -> Optional[Dict[str, Any]]:
+        """Parse the marketplace file on disk, or return None if unusable."""
+        existing = _load_json(marketplace_file)
+        return existing if isinstance(existing, dict) else None
 
-        return f"""- **{len(plugins)} Specialized Plugins**
-- **{total_commands} Custom Commands**
-- **{total_agents} Expert Agents**
-- **{total_skills} Specialized Skills**
-- **{total_hooks} Hooks**
-- **{total_mcp} MCP Servers**"""
+    @staticmethod
+    def content_changed(
+        existing: Optional[Dict[str, Any]], marketplace_data: Dict[str, Any]
+    ) -> bool:
+        """Check if marketplace content differs from the parsed file on disk.
+
+        Version and timestamp are ignored so that rebuilding unchanged plugins
+        leaves marketplace.json untouched.
+        """
+        if existing is None:
+            return True
+
+        def stable(data: Dict[str, Any]) -> Dict[str, Any]:
+            metadata = data.get("metadata")
+            if not isinstance(metadata, dict):
+                metadata = {}
+            metadata = {
+                key: value
+                for key, value in metadata.items()
+                if key not in MarketplaceGenerator.VOLATILE_METADATA_KEYS
+            }
+            return {**data, "metadata": metadata}
+
+        return stable(existing) != stable(marketplace_data)
 
     @staticmethod
-    def _generate_plugin_details(plugins: List[PluginInfo]) -> str:
-        """Generate detailed plugin information section."""
-        lines = []
+    def generate(plugins: List[PluginInfo], version: str) -> Dict[str, Any]:
+        """Generate marketplace.json structure."""
+        from datetime import datetime, timezone
+
+        last_updated = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        return {
+            "name": PluginManager.MARKETPLACE_NAME,
+            "owner": {"name": MarketplaceGenerator.OWNER_NAME},
+            "metadata": {
+                "version": version,
+                "description": MarketplaceGenerator.DESCRIPTION,
+                "lastUpdated": last_updated,
+            },
+            "plugins": [
+                {
+                    "name": plugin.key,
+                    "source": plugin.source,
+                    "description": plugin.description,
+                }
+                for plugin in plugins
+            ],
+        }
+
+
+class ReadmeGenerator:
+    """Generates README.md documentation."""
+
+    @staticmethod
+    def generate_main_readme(plugins: List[PluginInfo]) -> str:
+        """Generate main README.md for the marketplace."""
+        toc, summary, plugin_details = ReadmeGenerator._render_all(plugins)
+
+        return _MAIN_README_TEMPLATE.format_map(
+            {
+                "toc": toc,
+                "summary": summary,
+                "plugin_details": plugin_details,
+                "marketplace_name": PluginManager.MARKETPLACE_NAME,
+            }
+        )
+
+    @staticmethod
+    def _render_all(plugins: List[PluginInfo]) -> Tuple[str, str, str]:
+        """Render table of contents, summary and plugin details in one pass."""
+        toc = io.StringIO()
+        buf = io.StringIO()
+        total_commands = total_agents = total_skills = total_hooks = total_mcp = 0
 
         for i, plugin in enumerate(plugins):
+            components = plugin.components
+            n_commands, n_agents, n_skills, n_hooks, n_mcp = plugin.component_counts
+            total_commands += n_commands
+            total_agents += n_agents
+            total_skills += n_skills
+            total_hooks += n_hooks
+            total_mcp += n_mcp
+
+            # Table of contents entry
             if i > 0:
-                lines.append("---\n")
+                toc.write("\n")
+            toc.write(f"  - [{plugin.name}](#{plugin.anchor})")
 
-            lines.append(f"### {plugin.name}\n")
-            lines.append(f"{plugin.description}\n")
-            lines.append(
-                f"**📦 Install**: `/plugin install {plugin.key}@{PluginManager.MARKETPLACE_NAME}`\n"
-            )
+            # Plugin details
+            if i > 0:
+                buf.write("---\n\n")
 
-            # Add component details
-            components = plugin.components
+            buf.write(f"### {plugin.name}\n\n")
+            buf.write(f"{plugin.description}\n\n")
+            buf.write(f"**📦 Install**: `{plugin.install_command}`\n\n")
 
-            if components.commands:
-                lines.append(f"\n**Commands** ({len(components.commands)}):")
+            if n_commands:
+                buf.write(_CMD_HDR)
+                buf.write(str(n_commands))
+                buf.write("):\n")
                 for cmd in components.commands:
-                    lines.append(f"- `{cmd.name}`: {cmd.description}")
-                lines.append("")
+                    buf.write(f"- `{cmd.name}`: {cmd.description}\n")
+                buf.write("\n")
 
-            if components.agents:
-                lines.append(f"\n**Agents** ({len(components.agents)}):")
+            if n_agents:
+                buf.write(_AGENT_HDR)
+                buf.write(str(n_agents))
+                buf.write("):\n")
                 for agent in components.agents:
-                    lines.append(f"- **{agent.name}**: {agent.description}")
-                lines.append("")
+                    buf.write(f"- **{agent.name}**: {agent.description}\n")
+                buf.write("\n")
 
-            if components.skills:
-                lines.append(f"\n**Skills** ({len(components.skills)}):")
+            if n_skills:
+                buf.write(_SKILL_HDR)
+                buf.write(str(n_skills))
+                buf.write("):\n")
                 for skill in components.skills:
-                    lines.append(f"- **{skill.name}**: {skill.description}")
-                lines.append("")
+                    buf.write(f"- **{skill.name}**: {skill.description}\n")
+                buf.write("\n")
 
-            if components.hooks:
-                lines.append(f"\n**Hooks** ({len(components.hooks)}):")
+            if n_hooks:
+                buf.write(_HOOK_HDR)
+                buf.write(str(n_hooks))
+                buf.write("):\n")
                 for hook in components.hooks:
-                    lines.append(f"- **{hook.name}**: {hook.description}")
-                lines.append("")
+                    buf.write(f"- **{hook.name}**: {hook.description}\n")
+                buf.write("\n")
 
-            if components.mcp_servers:
-                lines.append(f"\n**MCP Servers** ({len(components.mcp_servers)}):")
+            if n_mcp:
+                buf.write(_MCP_HDR)
+                buf.write(str(n_mcp))
+                buf.write("):\n")
                 for mcp in components.mcp_servers:
-                    lines.append(f"- **{mcp.name}**: {mcp.description}")
-                lines.append("")
+                    buf.write(f"- **{mcp.name}**: {mcp.description}\n")
+                buf.write("\n")
+
+        summary = f"""- **{len(plugins)} Specialized Plugins**
+- **{total_commands} Custom Commands**
+- **{total_agents} Expert Agents**
+- **{total_skills} Specialized Skills**
+- **{total_hooks} Hooks**
+- **{total_mcp} MCP Servers**"""
 
-        return "\n".join(lines)
+        return toc.getvalue(), summary, buf.getvalue()
 
     @staticmethod
     def generate_plugin_readme(plugin: PluginInfo) -> str:
@@ -762,92 +1064,104 @@ All plugins in this collection are licensed under MIT License.
         components = plugin.components
 
         # Build component sections
-        sections = []
-
-        if components.commands:
-            sections.append(f"## Commands ({len(components.commands)})\n")
-            for cmd in components.commands:
-                sections.append(f"### `{cmd.name}`\n{cmd.description}\n")
-
-        if components.agents:
-            sections.append(f"## Agents ({len(components.agents)})\n")
-            for agent in components.agents:
-                sections.append(f"### {agent.name}\n{agent.description}\n")
-
-        if components.skills:
-            sections.append(f"## Skills ({len(components.skills)})\n")
-            for skill in components.skills:
-                sections.append(f"### {skill.name}\n{skill.description}\n")
-
-        if components.hooks:
-            sections.append(f"## Hooks ({len(components.hooks)})\n")
-            for hook in components.hooks:
-                sections.append(f"### {hook.name}\n{hook.description}\n")
-
-        if components.mcp_servers:
-            sections.append(f"## MCP Servers ({len(components.mcp_servers)})\n")
-            for mcp in components.mcp_servers:
-                sections.append(f"### {mcp.name}\n{mcp.description}\n")
-
-        component_section = (
-            "\n".join(sections) if sections else "No components defined.\n"
+        buf = io.StringIO()
+        for attr, label, item_template in _PLUGIN_README_SECTIONS:
+            items = getattr(components, attr)
+            if items:
+                buf.write(f"## {label} ({len(items)})\n\n")
+                buf.write("".join(map(item_template.format, items)))
+
+        component_section = buf.getvalue() or "No components defined.\n\n"
+
+        return _PLUGIN_README_TEMPLATE.format_map(
+            {
+                "name": plugin.name,
+                "description": plugin.description,
+                "component_section": component_section,
+                "install_command": plugin.install_command,
+                "marketplace_name": PluginManager.MARKETPLACE_NAME,
+            }
         )
 
-        return f"""# {plugin.name}
-
-{plugin.description}
-
-## Overview
-
-This plugin provides the following components:
-
-{component_section}
 
-## Installation
+# ============================================================================
+# Main Build Process
+# ============================================================================
 
-Install this plugin from the {PluginManager.MARKETPLACE_NAME} marketplace:
 
-```bash
-/plugin install {plugin.key}@{PluginManager.MARKETPLACE_NAME}
-```
+def _file_fingerprint(file_path: Path) -> Optional[List[int]]:
+    """Get (size, mtime_ns) of a file, or None if it does not exist."""
+    try:
+        file_stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return [file_stat.st_size, file_stat.st_mtime_ns]
 
-## Usage
 
-After installation, the components provided by this plugin will be available in your Claude Code environment.
+def _content_would_change(file_path: Path, new_content: Union[str, bytes]) -> bool:
+    """Check if writing new content would change the file."""
+    if isinstance(new_content, str):
+        new_content = new_content.encode("utf-8")
 
-- **Commands** can be used with slash commands (e.g., `/command-name`)
-- **Agents** provide specialized expertise for specific tasks
-- **Skills** enhance agent capabilities for particular domains
-- **Hooks** automate workflows and git operations
-- **MCP Servers** provide external tool integrations
+    try:
+        # A size mismatch settles it without reading the old file
+        if file_path.stat().st_size != len(new_content):
+            return True
+        return file_path.read_bytes() != new_content
+    except FileNotFoundError:
+        return True
 
-## Development
 
-This plugin is part of the {PluginManager.MARKETPLACE_NAME} marketplace collection. For development details, see the main repository.
+def _write_atomic(file_path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file and move it into place."""
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, file_path)
 
----
 
-*This README is automatically generated. Do not edit manually - run `python scripts/build-marketplace.py` to update.*
-"""
+def _write_if_changed(file_path: Path, new_content: Union[str, bytes]) -> bool:
+    """Atomically write content unless the file already holds it.
 
+    Returns True if the file was written.
+    """
+    if isinstance(new_content, str):
+        new_content = new_content.encode("utf-8")
 
-# ============================================================================
-# Main Build Process
-# ============================================================================
+    if not _content_would_change(file_path, new_content):
+        return False
+    _write_atomic(file_path, new_content)
+    return True
 
 
 class MarketplaceBuilder:
     """Orchestrates the marketplace build process."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, verbose: bool = True) -> None:
         self.project_root = project_root
+        self.verbose = verbose
         self.plugins_dir = project_root / "plugins"
         self.marketplace_dir = project_root / ".claude-plugin"
         self.marketplace_file = self.marketplace_dir / "marketplace.json"
         self.readme_file = project_root / "README.md"
+        self.build_cache_file = self.marketplace_dir / ".build-cache.json"
 
-    def build(self):
-        """Execute the complete build process."""
+    def build(self) -> None:
+        """Execute the complete build process.
+
+        Progress messages are buffered and written to stdout in a single write
+        at the end, or dropped entirely when not verbose. Warnings and errors
+        go straight to stderr so they are never suppressed.
+        """
+        log = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(log):
+                self._build()
+        finally:
+            if self.verbose:
+                sys.stdout.write(log.getvalue())
+
+    def _build(self) -> None:
+        """Run the build steps, printing progress to the current stdout."""
         print("=" * 70)
         print("Building marketplace configuration and documentation")
         print("=" * 70)
@@ -855,68 +1169,139 @@ class MarketplaceBuilder:
         # Ensure directories exist
         self.marketplace_dir.mkdir(exist_ok=True)
 
+        build_cache = self._load_build_cache()
+        descriptions = DescriptionCache(build_cache["descriptions"])
+
         # Discover plugins
         print("\n📂 Discovering plugins...")
-        plugins = PluginManager.discover_plugins(self.plugins_dir)
+        plugins = PluginManager.discover_plugins(self.plugins_dir, descriptions)
 
         if not plugins:
-            print("⚠️  No plugins found. Check the plugins/ directory structure.")
+            print(
+                "⚠️  No plugins found. Check the plugins/ directory structure.",
+                file=sys.stderr,
+            )
             return
 
         print(f"\n✓ Found {len(plugins)} plugins")
 
         # Generate marketplace.json
         print("\n📄 Generating marketplace.json...")
-        marketplace_data = MarketplaceGenerator.generate(plugins, self.marketplace_file)
-
-        with open(self.marketplace_file, "w", encoding="utf-8") as f:
-            json.dump(marketplace_data, f, indent=2, ensure_ascii=False)
+        # Parse the existing file once for both the version and the diff
+        existing_marketplace = MarketplaceGenerator.load_existing(self.marketplace_file)
+        current_version = VersionManager.get_current_version(existing_marketplace)
+        new_version = VersionManager.increment_version(current_version)
+        marketplace_data = MarketplaceGenerator.generate(plugins, new_version)
 
-        print(f"✓ Generated {self.marketplace_file}")
+        if MarketplaceGenerator.content_changed(existing_marketplace, marketplace_data):
+            print(f"Version: {current_version} -> {new_version}")
+            _write_atomic(
+                self.marketplace_file, MarketplaceGenerator.serialize(marketplace_data)
+            )
+            print(f"✓ Generated {self.marketplace_file}")
+        else:
+            print(f"Version: {current_version} (unchanged)")
+            print(f"⏭ {self.marketplace_file} (no changes)")
 
         # Generate main README
         print("\n📝 Generating main README.md...")
         readme_content = ReadmeGenerator.generate_main_readme(plugins)
 
-        with open(self.readme_file, "w", encoding="utf-8") as f:
-            f.write(readme_content)
-
-        print(f"✓ Generated {self.readme_file}")
+        if _write_if_changed(self.readme_file, readme_content):
+            print(f"✓ Generated {self.readme_file}")
+        else:
+            print(f"⏭ {self.readme_file} (no changes)")
 
         # Generate individual plugin READMEs
         print("\n📚 Generating individual plugin READMEs...")
-        self._build_plugin_readmes(plugins)
+        build_cache["plugins"] = self._build_plugin_readmes(
+            plugins, build_cache["plugins"]
+        )
+        build_cache["descriptions"] = descriptions.current
+        self._save_build_cache(build_cache)
 
         # Summary
         print("\n" + "=" * 70)
         print(f"✅ Successfully built marketplace with {len(plugins)} plugins")
         print("=" * 70)
 
-    def _content_would_change(self, file_path: Path, new_content: str) -> bool:
-        """Check if writing new content would change the file."""
-        if not file_path.exists():
-            return True
-
-        try:
-            existing_content = file_path.read_text(encoding="utf-8")
-            return existing_content != new_content
-        except (FileNotFoundError, UnicodeDecodeError):
-            return True
+    def _generator_hash(self) -> str:
+        """Hash of this script, so template changes invalidate the build cache."""
+        return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+    def _load_build_cache(self) -> Dict[str, Any]:
+        """Load the per-plugin README and component description caches,
+        discarding them if the generator changed."""
+        cache = _load_json(self.build_cache_file)
+        if (
+            not isinstance(cache, dict)
+            or cache.get("generator") != self._generator_hash()
+        ):
+            cache = {}
+        return {
+            "plugins": cache.get("plugins", {}),
+            "descriptions": cache.get("descriptions", {}),
+        }
 
-    def _build_plugin_readmes(self, plugins: List[PluginInfo]):
-        """Generate README for each plugin, only if content would change."""
-        for plugin in plugins:
-            plugin_dir = self.plugins_dir / plugin.key
-            readme_path = plugin_dir / "README.md"
+    def _save_build_cache(self, build_cache: Dict[str, Any]) -> None:
+        """Persist the build cache atomically."""
+        cache = {"generator": self._generator_hash(), **build_cache}
+        _write_atomic(
+            self.build_cache_file, json.dumps(cache, indent=2).encode("utf-8")
+        )
 
-            readme_content = ReadmeGenerator.generate_plugin_readme(plugin)
+    def _build_plugin_readmes(
+        self, plugins: List[PluginInfo], build_cache: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate README for each plugin, only if content would change.
+
+        Plugins are processed concurrently since the work is mostly file I/O;
+        messages are printed afterwards in plugin order. Returns the new cache
+        entries, which only cover the plugins found in this build.
+        """
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            results = list(
+                executor.map(
+                    self._build_plugin_readme,
+                    plugins,
+                    [build_cache.get(plugin.key) for plugin in plugins],
+                )
+            )
 
-            if self._content_would_change(readme_path, readme_content):
-                with open(readme_path, "w", encoding="utf-8") as f:
-                    f.write(readme_content)
-                print(f"  ✓ {readme_path}")
-            else:
-                print(f"  ⏭ {readme_path} (no changes)")
+        plugin_cache = {}
+        for plugin, (message, cache_entry) in zip(plugins, results):
+            print(message)
+            plugin_cache[plugin.key] = cache_entry
+        return plugin_cache
+
+    def _build_plugin_readme(
+        self, plugin: PluginInfo, cached: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Generate one plugin README and return its log message and cache entry.
+
+        A plugin whose inputs and README file are unchanged since the last
+        build is skipped without rendering or reading the README.
+        """
+        readme_path = self.plugins_dir / plugin.key / "README.md"
+
+        if (
+            cached is not None
+            and cached.get("input") == plugin.content_hash
+            and cached.get("output") == _file_fingerprint(readme_path)
+        ):
+            return f"  ⏭ {readme_path} (no changes)", cached
+
+        readme_content = ReadmeGenerator.generate_plugin_readme(plugin)
+
+        if _write_if_changed(readme_path, readme_content):
+            message = f"  ✓ {readme_path}"
+        else:
+            message = f"  ⏭ {readme_path} (no changes)"
+
+        return message, {
+            "input": plugin.content_hash,
+            "output": _file_fingerprint(readme_path),
+        }
 
 
 # ============================================================================
@@ -924,12 +1309,23 @@ class MarketplaceBuilder:
 # ============================================================================
 
 
-def main():
+def main() -> None:
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Build marketplace.json and README files from plugins/"
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Suppress progress output (warnings and errors are still shown)",
+    )
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
 
-    builder = MarketplaceBuilder(project_root)
+    builder = MarketplaceBuilder(project_root, verbose=not args.quiet)
     builder.build()
 
 
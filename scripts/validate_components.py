@@ -19,8 +19,40 @@ import json
 import os
 import re
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Thread pool size for validating plugins concurrently with --all
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Checkout this script belongs to; only plugins inside it use the results cache
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_RESULTS_CACHE_FILE = _REPO_ROOT / ".claude-plugin" / ".validate-cache.json"
+
+# Patterns compiled once at import instead of on every validator call
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+")
+_POSITIONAL_ARG_RE = re.compile(r"\$\d+")
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+def _load_json(file_path: Path) -> Any:
+    """Parse a JSON file, raising json.JSONDecodeError on invalid input"""
+    with open(file_path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Let the stdlib parser judge it and report the error
+    return json.loads(data.decode("utf-8"))
 
 
 # ANSI color codes for better UX
@@ -104,12 +136,10 @@ class ComponentValidator:
         for result in self.results:
             print(f"  {result}")
 
-        errors = sum(
-            1 for r in self.results if not r.is_valid and r.severity == "error"
-        )
-        warnings = sum(
-            1 for r in self.results if not r.is_valid and r.severity == "warning"
-        )
+        # Tally failed results by severity in a single pass
+        counts = Counter(r.severity for r in self.results if not r.is_valid)
+        errors = counts["error"]
+        warnings = counts["warning"]
 
         if errors > 0:
             print(f"\n{Colors.RED}✗{Colors.END} {errors} error(s) found")
@@ -141,8 +171,7 @@ class HooksValidator(ComponentValidator):
     def validate(self):
         """Validate hooks.json structure and content"""
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(self.file_path)
         except json.JSONDecodeError as e:
             self.add_result(False, f"Invalid JSON: {e.msg}", e.lineno, e.colno)
             return
@@ -328,7 +357,10 @@ class SkillValidator(ComponentValidator):
         """Validate SKILL.md structure and content"""
         try:
             with open(self.file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+                # Peek at the frontmatter marker before reading the body
+                content = f.read(4)
+                if content == "---\n":
+                    content += f.read()
         except Exception as e:
             self.add_result(False, f"Failed to read file: {e}")
             return
@@ -379,10 +411,8 @@ class SkillValidator(ComponentValidator):
                 key, value = line.split(":", 1)
                 key = key.strip()
                 value = value.strip()
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
+                # Remove matching quotes if present
+                if value[:1] in ('"', "'") and value.endswith(value[0]):
                     value = value[1:-1]
                 result[key] = value
         return result
@@ -497,9 +527,9 @@ class SkillValidator(ComponentValidator):
             )
 
         # Check for common file references
-        file_refs = re.findall(r"\[([^\]]+)\]\(([^)]+)\)", content)
+        file_refs = _MARKDOWN_LINK_RE.findall(content)
         for ref_text, ref_path in file_refs:
-            if ref_path.startswith("./") or ref_path.startswith("../"):
+            if ref_path.startswith(("./", "../")):
                 self.add_result(
                     True,
                     f"Found relative file reference: {ref_path}",
@@ -621,10 +651,8 @@ class CommandValidator(ComponentValidator):
                 key, value = line.split(":", 1)
                 key = key.strip()
                 value = value.strip()
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
+                # Remove matching quotes if present
+                if value[:1] in ('"', "'") and value.endswith(value[0]):
                     value = value[1:-1]
                 # Handle boolean values
                 if value.lower() in ["true", "false"]:
@@ -685,7 +713,7 @@ class CommandValidator(ComponentValidator):
         if has_arguments:
             # Check for valid argument patterns
             for i, line in enumerate(lines):
-                if "$ARGUMENTS" in line or re.search(r"\$\d+", line):
+                if "$ARGUMENTS" in line or _POSITIONAL_ARG_RE.search(line):
                     self.add_result(
                         True,
                         f"Found argument placeholder on line {i + 1}",
@@ -716,7 +744,10 @@ class AgentValidator(ComponentValidator):
         """Validate agent markdown file"""
         try:
             with open(self.file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+                # Peek at the frontmatter marker before reading the body
+                content = f.read(4)
+                if content == "---\n":
+                    content += f.read()
         except Exception as e:
             self.add_result(False, f"Failed to read file: {e}")
             return
@@ -767,10 +798,8 @@ class AgentValidator(ComponentValidator):
                 key, value = line.split(":", 1)
                 key = key.strip()
                 value = value.strip()
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
+                # Remove matching quotes if present
+                if value[:1] in ('"', "'") and value.endswith(value[0]):
                     value = value[1:-1]
                 # Handle boolean values
                 if value.lower() in ["true", "false"]:
@@ -893,12 +922,95 @@ class AgentValidator(ComponentValidator):
             )
 
 
+class ResultsCache:
+    """Per-file validation results kept between runs.
+
+    Entries are stored as path -> [size, mtime_ns, [[is_valid, message, line,
+    column, severity], ...]] and reused while the file is unchanged. The whole
+    cache is dropped when this script's own size or mtime changes.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.previous: Dict[str, list] = {}
+        self.current: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fingerprint(file_stat: os.stat_result) -> List[int]:
+        return [file_stat.st_size, file_stat.st_mtime_ns]
+
+    def load(self):
+        """Load the previous run's results if the validator is unchanged"""
+        try:
+            cache = _load_json(self.cache_file)
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(cache, dict)
+            and cache.get("validator") == self._fingerprint(os.stat(__file__))
+            and isinstance(cache.get("results"), dict)
+        ):
+            self.previous = cache["results"]
+
+    def save(self):
+        """Persist this run's results, keeping earlier entries for files
+        that were not validated this time but still exist"""
+        results = {
+            path: entry
+            for path, entry in self.previous.items()
+            if path not in self.current and os.path.exists(path)
+        }
+        results.update(self.current)
+        cache = {
+            "validator": self._fingerprint(os.stat(__file__)),
+            "results": results,
+        }
+        try:
+            self.cache_file.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        except OSError:
+            pass  # The cache is an optimisation; validation already succeeded
+
+    def run(
+        self, file_path: str, validate: Callable[[], List[ValidationResult]]
+    ) -> List[ValidationResult]:
+        """Return validate()'s results for file_path, reusing the previous
+        run's results when the file's size and mtime are unchanged"""
+        try:
+            fingerprint = self._fingerprint(os.stat(file_path))
+        except OSError:
+            return validate()
+
+        key = os.path.abspath(file_path)
+        cached = self.previous.get(key)
+        if cached is not None and cached[:2] == fingerprint:
+            results = [ValidationResult(*result) for result in cached[2]]
+        else:
+            results = validate()
+            cached = fingerprint + [
+                [[r.is_valid, r.message, r.line, r.column, r.severity] for r in results]
+            ]
+        with self._lock:
+            self.current[key] = cached
+        return results
+
+
 class PluginValidator:
     """Validator for entire plugin directories"""
 
-    def __init__(self, plugin_path: str):
+    # Required plugin.json fields with the JSON type each must hold
+    REQUIRED_FIELDS = (
+        ("name", str, "a string"),
+        ("version", str, "a string"),
+        ("description", str, "a string"),
+        ("author", dict, "an object"),
+        ("license", str, "a string"),
+    )
+
+    def __init__(self, plugin_path: str, cache: Optional["ResultsCache"] = None):
         self.plugin_path = Path(plugin_path)
         self.results: List[ValidationResult] = []
+        self.cache = cache
 
     def validate(self):
         """Validate entire plugin structure"""
@@ -925,70 +1037,92 @@ class PluginValidator:
                 ValidationResult(False, "Missing .claude-plugin/plugin.json")
             )
         else:
-            self._validate_plugin_json(plugin_json)
+            self._validate_file_cached(
+                str(plugin_json), lambda: self._validate_plugin_json(plugin_json)
+            )
+
+        # One listing of the plugin root stands in for per-directory probes
+        with os.scandir(self.plugin_path) as it:
+            top_level = {entry.name: entry for entry in it}
 
         # Validate components
-        self._validate_component_directory("commands", CommandValidator)
-        self._validate_component_directory("agents", AgentValidator)
-        self._validate_component_directory("skills", self._validate_skill_directory)
-        self._validate_component_directory("hooks", self._validate_hooks_directory)
+        for dir_name, validator_class in (
+            ("commands", CommandValidator),
+            ("agents", AgentValidator),
+            ("skills", self._validate_skill_directory),
+            ("hooks", self._validate_hooks_directory),
+        ):
+            self._validate_component_directory(
+                dir_name, validator_class, top_level.get(dir_name)
+            )
+
+    def _validate_file_cached(
+        self, file_path: str, validate: Callable[[], List[ValidationResult]]
+    ):
+        """Add validate()'s results for file_path, going through the results
+        cache when there is one"""
+        if self.cache is None:
+            self.results.extend(validate())
+        else:
+            self.results.extend(self.cache.run(file_path, validate))
+
+    def _validate_file(self, validator_class, file_path: str):
+        """Validate one component file, reusing cached results if unchanged"""
+
+        def validate() -> List[ValidationResult]:
+            validator = validator_class(file_path)
+            validator.validate()
+            return validator.results
+
+        self._validate_file_cached(file_path, validate)
 
-    def _validate_plugin_json(self, plugin_json_path: Path):
+    def _validate_plugin_json(self, plugin_json_path: Path) -> List[ValidationResult]:
         """Validate plugin.json file"""
+        results: List[ValidationResult] = []
         try:
-            with open(plugin_json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(plugin_json_path)
         except json.JSONDecodeError as e:
-            self.results.append(
+            results.append(
                 ValidationResult(
                     False, f"Invalid JSON in plugin.json: {e.msg}", e.lineno, e.colno
                 )
             )
-            return
+            return results
         except Exception as e:
-            self.results.append(
-                ValidationResult(False, f"Failed to read plugin.json: {e}")
-            )
-            return
+            results.append(ValidationResult(False, f"Failed to read plugin.json: {e}"))
+            return results
 
         # Validate required fields
-        required_fields = {"name", "version", "description", "author", "license"}
-        for field in required_fields:
+        for field, expected_type, type_name in self.REQUIRED_FIELDS:
             if field not in data:
-                self.results.append(
+                results.append(
                     ValidationResult(
                         False, f"Missing required field in plugin.json: {field}"
                     )
                 )
-            elif field == "author":
-                if not isinstance(data[field], dict):
-                    self.results.append(
-                        ValidationResult(
-                            False, "Field 'author' in plugin.json must be an object"
-                        )
+            elif not isinstance(data[field], expected_type):
+                results.append(
+                    ValidationResult(
+                        False, f"Field '{field}' in plugin.json must be {type_name}"
                     )
-                elif "name" not in data[field]:
-                    self.results.append(
+                )
+            elif field == "author":
+                if "name" not in data[field]:
+                    results.append(
                         ValidationResult(
                             False, "Author object must have a 'name' field"
                         )
                     )
                 elif not isinstance(data[field]["name"], str):
-                    self.results.append(
+                    results.append(
                         ValidationResult(False, "Author 'name' field must be a string")
                     )
-            elif not isinstance(data[field], str):
-                self.results.append(
-                    ValidationResult(
-                        False, f"Field '{field}' in plugin.json must be a string"
-                    )
-                )
 
         # Validate version format
         if "version" in data:
             version = data["version"]
-            if not re.match(r"^\d+\.\d+\.\d+", version):
-                self.results.append(
+            if not _SEMVER_RE.match(version):
+                results.append(
                     ValidationResult(
                         False,
                         "Version should follow semantic versioning (x.y.z)",
@@ -998,32 +1132,40 @@ class PluginValidator:
                     )
                 )
 
-    def _validate_component_directory(self, dir_name: str, validator_class):
-        """Validate a component directory"""
-        component_dir = self.plugin_path / dir_name
-        if not component_dir.exists():
+        return results
+
+    def _validate_component_directory(
+        self, dir_name: str, validator_class, dir_entry: Optional[os.DirEntry]
+    ):
+        """Validate a component directory from its entry in the plugin root"""
+        if dir_entry is None:
             return  # Optional directory
 
-        if not component_dir.is_dir():
-            self.results.append(
-                ValidationResult(False, f"{dir_name} should be a directory")
-            )
+        if not dir_entry.is_dir():
+            # A dangling symlink counts as absent, like Path.exists()
+            if os.path.exists(dir_entry.path):
+                self.results.append(
+                    ValidationResult(False, f"{dir_name} should be a directory")
+                )
             return
+        component_dir = dir_entry.path
+
+        # One directory listing, filtered by name suffix rather than glob()
+        with os.scandir(component_dir) as it:
+            entries = list(it)
 
         if dir_name == "skills":
             # Special handling for skills (subdirectories)
-            for skill_dir in component_dir.iterdir():
-                if skill_dir.is_dir():
-                    skill_md = skill_dir / "SKILL.md"
-                    if skill_md.exists():
-                        validator = SkillValidator(str(skill_md))
-                        validator.validate()
-                        self.results.extend(validator.results)
+            for entry in entries:
+                if entry.is_dir():
+                    skill_md = os.path.join(entry.path, "SKILL.md")
+                    if os.path.exists(skill_md):
+                        self._validate_file(SkillValidator, skill_md)
                     else:
                         self.results.append(
                             ValidationResult(
                                 False,
-                                f"Skill directory {skill_dir.name} missing SKILL.md",
+                                f"Skill directory {entry.name} missing SKILL.md",
                                 None,
                                 None,
                                 "warning",
@@ -1031,16 +1173,14 @@ class PluginValidator:
                         )
         elif dir_name == "hooks":
             # Special handling for hooks (JSON files)
-            for hook_file in component_dir.glob("*.json"):
-                validator = HooksValidator(str(hook_file))
-                validator.validate()
-                self.results.extend(validator.results)
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    self._validate_file(HooksValidator, entry.path)
         else:
             # Commands and agents (markdown files)
-            for md_file in component_dir.glob("*.md"):
-                validator = validator_class(str(md_file))
-                validator.validate()
-                self.results.extend(validator.results)
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    self._validate_file(validator_class, entry.path)
 
     def _validate_skill_directory(self, skill_dir: Path):
         """Validate a single skill directory"""
@@ -1092,12 +1232,10 @@ class PluginValidator:
         for result in self.results:
             print(f"  {result}")
 
-        errors = sum(
-            1 for r in self.results if not r.is_valid and r.severity == "error"
-        )
-        warnings = sum(
-            1 for r in self.results if not r.is_valid and r.severity == "warning"
-        )
+        # Tally failed results by severity in a single pass
+        counts = Counter(r.severity for r in self.results if not r.is_valid)
+        errors = counts["error"]
+        warnings = counts["warning"]
 
         if errors > 0:
             print(f"\n{Colors.RED}✗{Colors.END} {errors} error(s) found")
@@ -1107,6 +1245,26 @@ class PluginValidator:
             print(f"\n{Colors.GREEN}✓{Colors.END} All checks passed")
 
 
+def _validate_plugin_dir(
+    plugin_dir: Path, cache: Optional[ResultsCache] = None
+) -> PluginValidator:
+    """Run a PluginValidator over one plugin directory"""
+    validator = PluginValidator(str(plugin_dir), cache)
+    validator.validate()
+    return validator
+
+
+def _open_results_cache(target: str) -> Optional[ResultsCache]:
+    """Load the results cache if target lies inside this checkout, so
+    validating a plugin elsewhere never writes into it"""
+    target_path = Path(target).resolve()
+    if target_path != _REPO_ROOT and _REPO_ROOT not in target_path.parents:
+        return None
+    cache = ResultsCache(_RESULTS_CACHE_FILE)
+    cache.load()
+    return cache
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Claude Code components (hooks, skills, commands, agents)",
@@ -1144,6 +1302,11 @@ Examples:
     parser.add_argument(
         "--quiet", action="store_true", help="Only show errors and warnings"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalidate every file instead of reusing unchanged results",
+    )
     parser.add_argument(
         "--version", action="version", version="Claude Code Component Validator 1.0.0"
     )
@@ -1152,6 +1315,11 @@ Examples:
 
     success = True
 
+    # Plugin-level runs reuse results for files unchanged since the last run
+    cache = None
+    if not args.no_cache and (args.plugin or args.all):
+        cache = _open_results_cache(args.plugin or args.all)
+
     try:
         if args.hooks:
             validator = HooksValidator(args.hooks)
@@ -1184,7 +1352,7 @@ Examples:
             success = not validator.has_errors()
 
         elif args.plugin:
-            validator = PluginValidator(args.plugin)
+            validator = PluginValidator(args.plugin, cache)
             validator.validate()
             validator.print_results()
             success = not any(
@@ -1197,26 +1365,31 @@ Examples:
                 print(f"{Colors.RED}Error: {args.all} is not a directory{Colors.END}")
                 sys.exit(1)
 
-            plugin_dirs = [
-                d
-                for d in all_path.iterdir()
-                if d.is_dir() and (d / ".claude-plugin").exists()
-            ]
+            with os.scandir(all_path) as it:
+                plugin_dirs = [
+                    Path(entry.path)
+                    for entry in it
+                    if entry.is_dir()
+                    and os.path.exists(os.path.join(entry.path, ".claude-plugin"))
+                ]
 
             if not plugin_dirs:
                 print(f"{Colors.YELLOW}No plugins found in {args.all}{Colors.END}")
                 sys.exit(0)
 
+            # Plugins validate independently; results are printed in order
             all_success = True
-            for plugin_dir in plugin_dirs:
-                validator = PluginValidator(str(plugin_dir))
-                validator.validate()
-                validator.print_results()
-                if any(
-                    not r.is_valid and r.severity == "error" for r in validator.results
+            with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+                for validator in executor.map(
+                    _validate_plugin_dir, plugin_dirs, [cache] * len(plugin_dirs)
                 ):
-                    all_success = False
-                print()  # Add spacing between plugins
+                    validator.print_results()
+                    if any(
+                        not r.is_valid and r.severity == "error"
+                        for r in validator.results
+                    ):
+                        all_success = False
+                    print()  # Add spacing between plugins
 
             success = all_success
 
@@ -1227,6 +1400,9 @@ Examples:
         print(f"{Colors.RED}Unexpected error: {e}{Colors.END}")
         sys.exit(1)
 
+    if cache is not None:
+        cache.save()
+
     sys.exit(0 if success else 1)
 
 